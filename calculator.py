@@ -1,207 +1,421 @@
 import tkinter as tk
-import re
-from config import CalculatorConfig, DisplayConfig
+import functools
+from config import (
+    CalculatorConfig,
+    INITIAL_DISPLAY,
+    EMPTY_HISTORY,
+    MAX_DISPLAY_LENGTH,
+    SCIENTIFIC_PRECISION,
+    DECIMAL_PLACES,
+    OPERATORS_SET,
+    OPERATORS_PCT,
+    OPERATORS_DOT,
+    OP_OR_SPECIAL,
+)
 from utilities import _get_button_colors
 
 
-class InputValidator:
-    '''Validates calculator input according to business rules'''
-    
-    @staticmethod
-    def can_append_digit(expression, digit):
-        '''
-        Checks if digit can be appended to expression.
-        
-        Args:
-            expression (str): Current expression
-            digit (str): Digit to append
-            
-        Returns:
-            bool: True if digit can be appended
-        '''
-        if not expression:
-            if digit == '0':
-                return False
+# ASCII digits only: faster than str.isdigit on single chars and avoids
+# accepting Unicode digits the validators never intended to allow
+_DIGITS = frozenset('0123456789')
+
+# Classifies the last expression character in one dict lookup:
+# 'D' digit, 'O' operator, 'P' percent, '.' dot, '(' / ')' parens
+_CHAR_KIND = {char: 'D' for char in _DIGITS}
+_CHAR_KIND.update({char: 'O' for char in '+-×÷'})
+_CHAR_KIND.update({'%': 'P', '.': '.', '(': '(', ')': ')'})
+
+# Regex patterns are compiled lazily on the first action that needs them,
+# keeping the `re` import (and pattern compilation) off the startup path
+# so the window paints sooner; once built they live for the session
+_patterns = None
+
+
+def _ensure_patterns():
+    '''
+    Compiles the regex patterns on first use.
+
+    Returns:
+        SimpleNamespace: Namespace with the compiled patterns
+    '''
+    global _patterns
+    if _patterns is None:
+        import re
+        from types import SimpleNamespace
+        _patterns = SimpleNamespace(
+            last_number = re.compile(r'(?:\d+(?:\.\d+)?|\(-\d+(?:\.\d+)?\)|\(\d+(?:\.\d+)?\))$'),
+            tokens = re.compile(r'\(-?\d+(?:\.\d+)?\)%?|-?\d+(?:\.\d+)?%?|[+\-*/()]'),
+            binary = re.compile(r'^(-?\d+(?:\.\d+)?)([+\-*/])(-?\d+(?:\.\d+)?)$'),
+        )
+    return _patterns
+
+# Operator normalization and precedence for the expression evaluator
+_OP_MAP = {'+': '+', '-': '-', '*': '*', '/': '/', '×': '*', '÷': '/'}
+_OP_TRANS = str.maketrans({'×': '*', '÷': '/'})
+_PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2}
+_BINARY_OPS = {
+    '+': lambda left, right: left + right,
+    '-': lambda left, right: left - right,
+    '*': lambda left, right: left * right,
+    '/': lambda left, right: left / right,
+}
+
+
+def _tokenize(expression):
+    '''
+    Tokenizes a normalized expression into (kind, value) pairs.
+
+    Enforces operand/operator alternation so malformed streams (e.g.
+    two adjacent operand groups) fail here rather than evaluating to
+    a wrong number.
+
+    Args:
+        expression (str): Expression to tokenize
+
+    Returns:
+        list: Tokens of kind 'num', 'op', '(' or ')'
+
+    Raises:
+        ValueError: If the expression is malformed
+    '''
+    tokens = []
+    i = 0
+    n = len(expression)
+    expect_operand = True
+
+    while i < n:
+        char = expression[i]
+        if char == '-' and expect_operand and i + 1 < n and expression[i + 1] == '(':
+            # Unary minus before a paren group (toggle_sign on a negative
+            # result yields forms like -(-51735)): rewrite as 0 - (...)
+            tokens.append(('num', 0.0))
+            tokens.append(('op', '-'))
+            i += 1
+        elif char in '0123456789.' or (char == '-' and expect_operand):
+            if not expect_operand:
+                raise ValueError('unexpected operand')
+            j = i + 1
+            while j < n and expression[j] in '0123456789.':
+                j += 1
+            # Optional scientific-notation exponent: results fed back into
+            # the expression can carry forms like 1.000000e-07
+            if j < n and expression[j] in 'eE':
+                k = j + 1
+                if k < n and expression[k] in '+-':
+                    k += 1
+                if k < n and expression[k] in '0123456789':
+                    while k < n and expression[k] in '0123456789':
+                        k += 1
+                    j = k
+            tokens.append(('num', float(expression[i:j])))
+            expect_operand = False
+            i = j
+        elif char == '(':
+            if not expect_operand:
+                raise ValueError('unexpected operand')
+            tokens.append(('(', '('))
+            i += 1
+        elif char == ')':
+            if expect_operand:
+                raise ValueError('unexpected operator')
+            tokens.append((')', ')'))
+            i += 1
+        else:
+            if expect_operand:
+                raise ValueError('unexpected operator')
+            tokens.append(('op', _OP_MAP[char]))
+            expect_operand = True
+            i += 1
+
+    if expect_operand:
+        raise ValueError('incomplete expression')
+    return tokens
+
+
+def _eval_tokens(tokens):
+    '''
+    Evaluates a token stream with a shunting-yard operand/operator stack.
+
+    Args:
+        tokens (list): Tokens produced by _tokenize
+
+    Returns:
+        float: Evaluation result
+
+    Raises:
+        ValueError: If the expression is malformed
+        ZeroDivisionError: On division by zero
+    '''
+    operands = []
+    operators = []
+
+    def apply_operator():
+        operator = operators.pop()
+        right = operands.pop()
+        left = operands.pop()
+        if operator == '+':
+            operands.append(left + right)
+        elif operator == '-':
+            operands.append(left - right)
+        elif operator == '*':
+            operands.append(left * right)
+        else:
+            operands.append(left / right)
+
+    for kind, value in tokens:
+        if kind == 'num':
+            operands.append(value)
+        elif kind == '(':
+            operators.append('(')
+        elif kind == ')':
+            while operators and operators[-1] != '(':
+                apply_operator()
+            operators.pop()
+        else:
+            while operators and operators[-1] != '(' and _PRECEDENCE[operators[-1]] >= _PRECEDENCE[value]:
+                apply_operator()
+            operators.append(value)
+
+    while operators:
+        apply_operator()
+
+    if len(operands) != 1:
+        raise ValueError('malformed expression')
+    return operands[0]
+
+
+def _last_segment_has_dot(expression, end):
+    '''
+    Checks if the number segment ending at index end contains a dot.
+
+    Args:
+        expression (str): Expression to scan
+        end (int): Index one past the segment's last character
+
+    Returns:
+        bool: True if the segment contains a decimal point
+    '''
+    for i in range(end - 1, -1, -1):
+        char = expression[i]
+        if char in '+-×÷()':
+            return False
+        if char == '.':
             return True
-        
-        last_char = expression[-1]
-            
-        if len(expression) >= 2 and last_char == '0':
-            if expression[-2] in CalculatorConfig.OPERATORS + ['%']:
-                return False
-                
-        if expression and last_char == '%':
+    return False
+
+
+@functools.lru_cache(maxsize = 256)
+def _format_result_cached(result):
+    '''
+    Formats a float result for display, memoized for repeated results.
+
+    Args:
+        result (float): Calculation result
+
+    Returns:
+        str: Formatted result string
+    '''
+    if result.is_integer():
+        result_int = int(result)
+        result_str = str(result_int)
+
+        if len(result_str) > MAX_DISPLAY_LENGTH:
+            return f'{result:.{SCIENTIFIC_PRECISION}e}'
+        return result_str
+
+    if abs(result) >= 1e12 or (abs(result) < 1e-6 and result != 0):
+        return f'{result:.{SCIENTIFIC_PRECISION}e}'
+
+    result_str = f'{result:.{DECIMAL_PLACES}f}'.rstrip('0').rstrip('.')
+
+    if len(result_str) > MAX_DISPLAY_LENGTH:
+        return f'{result:.{SCIENTIFIC_PRECISION}e}'
+
+    return result_str
+
+
+def can_append_digit(expression, digit):
+    '''
+    Checks if digit can be appended to expression.
+
+    Args:
+        expression (str): Current expression
+        digit (str): Digit to append
+
+    Returns:
+        bool: True if digit can be appended
+    '''
+    if not expression:
+        if digit == '0':
             return False
-            
         return True
-    
-    @staticmethod
-    def can_append_operator(expression):
-        '''
-        Checks if operator can be appended to expression.
-        
-        Args:
-            expression (str): Current expression
-            operator (str): Operator to append
-            
-        Returns:
-            bool: True if operator can be appended
-        '''
-        if not expression:
-            return True
-            
-        last_char = expression[-1]
 
-        if last_char in CalculatorConfig.OPERATORS or last_char in CalculatorConfig.SPECIAL_CHARS:
-            return True
+    last_char = expression[-1]
 
-        if last_char.isdigit():
-            return True
-            
+    if len(expression) >= 2 and last_char == '0':
+        if expression[-2] in OPERATORS_PCT:
+            return False
+
+    if expression and last_char == '%':
         return False
-    
-    @staticmethod
-    def can_append_dot(expression):
-        '''
-        Checks if decimal point can be appended to expression.
-        
-        Args:
-            expression (str): Current expression
-            
-        Returns:
-            bool: True if dot can be appended
-        '''
-        if not expression:
-            return True
-            
-        last_char = expression[-1]
 
-        number_segments = re.split(r'[\+\-\×÷\(\)]', expression)      
-        if last_char.isdigit() and '.' not in number_segments[-1]:
+    return True
+
+
+def can_append_operator(expression):
+    '''
+    Checks if operator can be appended to expression.
+
+    Args:
+        expression (str): Current expression
+
+    Returns:
+        bool: True if operator can be appended
+    '''
+    if not expression:
+        return True
+
+    last_char = expression[-1]
+
+    if last_char in OP_OR_SPECIAL:
+        return True
+
+    if last_char in _DIGITS:
+        return True
+
+    return False
+
+
+def can_append_dot(expression):
+    '''
+    Checks if decimal point can be appended to expression.
+
+    Args:
+        expression (str): Current expression
+
+    Returns:
+        bool: True if dot can be appended
+    '''
+    if not expression:
+        return True
+
+    last_char = expression[-1]
+
+    if last_char in _DIGITS and not _last_segment_has_dot(expression, len(expression)):
+        return True
+    elif last_char in OPERATORS_SET and not _last_segment_has_dot(expression, len(expression) - 1):
+        if len(expression) >= 2 and expression[-2] not in [')', '%']:
             return True
-        elif last_char in CalculatorConfig.OPERATORS and '.' not in number_segments[-2]:
-            if expression[-2] not in [')', '%']:
-                return True
-                
-        return False
 
+    return False
 
-class ExpressionBuilder:
-    '''Builds and modifies calculator expressions'''
-    
-    @staticmethod
-    def normalize_number(number_string):
-        '''
-        Converts string representation to float.
-        
-        Args:
-            number_string (str): String with possible parentheses
-            
-        Returns:
-            float: Normalized number
-        '''
-        return float(number_string.strip('()'))
-    
-    @staticmethod
-    def format_number(number):
-        '''
-        Formats number for display in expression.
-        
-        Args:
-            number (float): Number to format
-            
-        Returns:
-            str: Formatted number string
-        '''
-        if number.is_integer():
-            return '({})'.format(int(number)) if number < 0 else str(int(number))
-        return '({})'.format(number) if number < 0 else str(number)
-    
-    @staticmethod
-    def append_digit_to_expression(expression, digit):
-        '''
-        Appends digit to expression with proper formatting.
-        
-        Args:
-            expression (str): Current expression
-            digit (str): Digit to append
-            
-        Returns:
-            str: Updated expression
-        '''
-        if expression and expression[-1] == ')':
-            return expression + '×' + digit
-        return expression + digit
-    
-    @staticmethod
-    def append_operator_to_expression(expression, operator):
-        '''
-        Appends operator to expression.
-        
-        Args:
-            expression (str): Current expression
-            operator (str): Operator to append
-            
-        Returns:
-            str: Updated expression
-        '''
-        if not expression:
-            return '0' + operator
-            
-        last_char = expression[-1]
 
-        if last_char in CalculatorConfig.OPERATORS + ['.']:
-            return expression[:-1] + operator
-            
-        return expression + operator
+def normalize_number(number_string):
+    '''
+    Converts string representation to float.
+
+    Args:
+        number_string (str): String with possible parentheses
+
+    Returns:
+        float: Normalized number
+    '''
+    if number_string[0] == '(':
+        number_string = number_string[1:-1]
+    return float(number_string)
+
+
+def format_number(number):
+    '''
+    Formats number for display in expression.
+
+    Args:
+        number (float): Number to format
+
+    Returns:
+        str: Formatted number string
+    '''
+    value = int(number) if number.is_integer() else number
+    formatted = str(value)
+    return f'({formatted})' if value < 0 else formatted
+
+
+def append_digit_to_expression(expression, digit):
+    '''
+    Appends digit to expression with proper formatting.
+
+    Args:
+        expression (str): Current expression
+        digit (str): Digit to append
+
+    Returns:
+        str: Updated expression
+    '''
+    if expression and expression[-1] == ')':
+        return expression + '×' + digit
+    return expression + digit
+
+
+def append_operator_to_expression(expression, operator):
+    '''
+    Appends operator to expression.
+
+    Args:
+        expression (str): Current expression
+        operator (str): Operator to append
+
+    Returns:
+        str: Updated expression
+    '''
+    if not expression:
+        return '0' + operator
+
+    last_char = expression[-1]
+
+    if last_char in OPERATORS_DOT:
+        return expression[:-1] + operator
+
+    return expression + operator
 
 
 class CalculationState:
     '''Manages the state of calculator operations'''
-    
+
+    __slots__ = ('expression', 'is_calculation_done')
+
     def __init__(self):
-        self._expression = ''
-        self._calculation_done = False
-    
-    @property
-    def expression(self):
-        '''Gets current expression'''
-        return self._expression
-    
-    @property
-    def is_calculation_done(self):
-        '''Gets calculation completion status'''
-        return self._calculation_done
-    
+        self.expression = ''
+        self.is_calculation_done = False
+
     def set_expression(self, expression):
         '''
         Sets the current expression.
-        
+
         Args:
             expression (str): New expression
         '''
-        self._expression = expression
-    
+        self.expression = expression
+
     def mark_calculation_done(self):
         '''Marks calculation as completed'''
-        self._calculation_done = True
-    
+        self.is_calculation_done = True
+
     def reset_calculation_state(self):
         '''Resets calculation completion flag'''
-        self._calculation_done = False
-    
+        self.is_calculation_done = False
+
     def clear_expression(self):
         '''Clears the current expression'''
-        self._expression = ''
+        self.expression = ''
 
 
 class ExpressionManager:
     '''Coordinates expression building, validation, and state management'''
-    
+
+    __slots__ = ('state',)
+
     def __init__(self):
         self.state = CalculationState()
-        self.builder = ExpressionBuilder()
-        self.validator = InputValidator()
     
     def _return_change_result(self, has_changed, display_value = None):
         '''
@@ -215,7 +429,7 @@ class ExpressionManager:
             tuple: (has_changed, display_value)
         '''
         if display_value is not None:
-            return (has_changed, CalculatorConfig.INITIAL_DISPLAY)
+            return (has_changed, INITIAL_DISPLAY)
         return (has_changed, self.state.expression)
     
     def add_digit(self, digit):
@@ -228,25 +442,21 @@ class ExpressionManager:
         Returns:
             tuple: (success: bool, updated_expression: str)
         '''
-        try:
-            if self.state.is_calculation_done:
-                if digit == '0':
-                    self.state.clear_expression()
-                    self.state.reset_calculation_state()
-                    return self._return_change_result(True, CalculatorConfig.INITIAL_DISPLAY)
-                self.state.set_expression(digit)
+        if self.state.is_calculation_done:
+            if digit == '0':
+                self.state.clear_expression()
                 self.state.reset_calculation_state()
-                return self._return_change_result(True)
-            
-            if not self.validator.can_append_digit(self.state.expression, digit):
-                return self._return_change_result(False)
-            
-            updated_expression = self.builder.append_digit_to_expression(self.state.expression, digit)
-            self.state.set_expression(updated_expression)
+                return self._return_change_result(True, INITIAL_DISPLAY)
+            self.state.set_expression(digit)
+            self.state.reset_calculation_state()
             return self._return_change_result(True)
-            
-        except Exception as e:
+
+        if not can_append_digit(self.state.expression, digit):
             return self._return_change_result(False)
+
+        updated_expression = append_digit_to_expression(self.state.expression, digit)
+        self.state.set_expression(updated_expression)
+        return self._return_change_result(True)
     
     def add_operator(self, operator):
         '''
@@ -258,19 +468,15 @@ class ExpressionManager:
         Returns:
             tuple: (success: bool, updated_expression: str)
         '''
-        try:
-            if self.state.is_calculation_done:
-                self.state.reset_calculation_state()
-            
-            if not self.validator.can_append_operator(self.state.expression):
-                return self._return_change_result(False)
-            
-            updated_expression = self.builder.append_operator_to_expression(self.state.expression, operator)
-            self.state.set_expression(updated_expression)
-            return self._return_change_result(True)
-            
-        except Exception as e:
+        if self.state.is_calculation_done:
+            self.state.reset_calculation_state()
+
+        if not can_append_operator(self.state.expression):
             return self._return_change_result(False)
+
+        updated_expression = append_operator_to_expression(self.state.expression, operator)
+        self.state.set_expression(updated_expression)
+        return self._return_change_result(True)
                 
     def add_decimal_point(self):
         '''
@@ -279,35 +485,32 @@ class ExpressionManager:
         Returns:
             tuple: (success: bool, updated_expression: str)
         '''
-        try:
-            if self.state.is_calculation_done:
-                self.state.set_expression('0.')
-                self.state.reset_calculation_state()
-                return self._return_change_result(True)
-            
-            if not self.state.expression:
-                self.state.set_expression('0.')
-                return self._return_change_result(True)
-            
-            if not self.validator.can_append_dot(self.state.expression):
-                return self._return_change_result(False)
-            
-            last_char = self.state.expression[-1]
+        state = self.state
+        if state.is_calculation_done:
+            state.set_expression('0.')
+            state.reset_calculation_state()
+            return self._return_change_result(True)
 
-            if last_char.isdigit():
-                self.state.set_expression(self.state.expression + '.')
-                return self._return_change_result(True)
-            elif last_char in CalculatorConfig.OPERATORS:
-                if self.state.expression[-2] not in [')', '%']:
-                    updated_expression = self.state.expression[:-1] + '.'
-                    self.state.set_expression(updated_expression)
-                    return self._return_change_result(True)
-            
-            return self._return_change_result(False)
-            
-        except Exception as e:
+        expression = state.expression
+        if not expression:
+            state.set_expression('0.')
+            return self._return_change_result(True)
+
+        if not can_append_dot(expression):
             return self._return_change_result(False)
 
+        kind = _CHAR_KIND.get(expression[-1])
+
+        if kind == 'D':
+            state.set_expression(expression + '.')
+            return self._return_change_result(True)
+        elif kind == 'O' and len(expression) >= 2:
+            if expression[-2] not in (')', '%'):
+                state.set_expression(expression[:-1] + '.')
+                return self._return_change_result(True)
+
+        return self._return_change_result(False)
+
     def toggle_sign(self):
         '''
         Toggles the sign of the last number in expression.
@@ -315,26 +518,24 @@ class ExpressionManager:
         Returns:
             tuple: (success: bool, updated_expression: str)
         '''
-        try:
-            if self.state.is_calculation_done:
-                self.state.reset_calculation_state()
-            
-            match = re.search(r'(?:\d+(?:\.\d+)?|\(-\d+(?:\.\d+)?\)|\(\d+(?:\.\d+)?\))$', self.state.expression)
-            if not match:
-                return self._return_change_result(False)
-            
-            last_number_float = self.builder.normalize_number(match.group())
-            if last_number_float == 0:
-                return self._return_change_result(False)
+        state = self.state
+        if state.is_calculation_done:
+            state.reset_calculation_state()
 
-            new_number = -last_number_float
-            updated_expression = self.state.expression[:match.start()] + self.builder.format_number(new_number)
-            self.state.set_expression(updated_expression)
-            return self._return_change_result(True)
-            
-        except Exception as e:
+        expression = state.expression
+        match = _ensure_patterns().last_number.search(expression)
+        if not match:
+            return self._return_change_result(False)
+
+        last_number_float = normalize_number(match.group())
+        if last_number_float == 0:
             return self._return_change_result(False)
 
+        new_number = -last_number_float
+        updated_expression = expression[:match.start()] + format_number(new_number)
+        state.set_expression(updated_expression)
+        return self._return_change_result(True)
+
     def add_percent(self):
         '''
         Adds percent symbol to current expression.
@@ -342,29 +543,26 @@ class ExpressionManager:
         Returns:
             tuple: (success: bool, updated_expression: str)
         '''
-        try:
-            if self.state.is_calculation_done:
-                self.state.reset_calculation_state()
-            
-            if not self.state.expression:
-                return self._return_change_result(False)
-            
-            last_char = self.state.expression[-1]
-            
-            if last_char in CalculatorConfig.OPERATORS and self.state.expression[-2] == '%':
-                return self._return_change_result(False)
-            
-            if last_char in CalculatorConfig.OPERATORS + ['%', '.']:
-                updated_expression = self.state.expression[:-1] + '%'
-                self.state.set_expression(updated_expression)
-                return self._return_change_result(True)
-            else:
-                self.state.set_expression(self.state.expression + '%')
-                return self._return_change_result(True)
-                
-        except Exception as e:
+        state = self.state
+        if state.is_calculation_done:
+            state.reset_calculation_state()
+
+        expression = state.expression
+        if not expression:
+            return self._return_change_result(False)
+
+        kind = _CHAR_KIND.get(expression[-1])
+
+        if kind == 'O' and len(expression) >= 2 and expression[-2] == '%':
             return self._return_change_result(False)
 
+        if kind in ('O', 'P', '.'):
+            state.set_expression(expression[:-1] + '%')
+            return self._return_change_result(True)
+        else:
+            state.set_expression(expression + '%')
+            return self._return_change_result(True)
+
     def clear_last_input(self):
         '''
         Clears the last input from expression.
@@ -372,36 +570,30 @@ class ExpressionManager:
         Returns:
             tuple: (success: bool, updated_expression: str)
         '''
-        try:
-            if self.state.is_calculation_done:
-                self.state.clear_expression()
-                self.state.reset_calculation_state()
-                return self._return_change_result(True, CalculatorConfig.INITIAL_DISPLAY)
-            
-            if len(self.state.expression) <= 1:
-                self.state.clear_expression()
-                return self._return_change_result(True, CalculatorConfig.INITIAL_DISPLAY)
-            
-            if self.state.expression[-1] == ')':
-                for i in range(len(self.state.expression) - 1, -1, -1):
-                    if self.state.expression[i] == '(':
-                        updated_expression = self.state.expression[:i] + self.state.expression[i + 2: -1]
-                        self.state.set_expression(updated_expression)
-                        break
-                else:
-                    return self._return_change_result(False)
-                return self._return_change_result(True)
-            
-            if len(self.state.expression) == 2 and self.state.expression[0] == '0':
-                self.state.clear_expression()
-                return self._return_change_result(True, CalculatorConfig.INITIAL_DISPLAY)
-            
-            updated_expression = self.state.expression[:-1]
-            self.state.set_expression(updated_expression)
+        state = self.state
+        if state.is_calculation_done:
+            state.clear_expression()
+            state.reset_calculation_state()
+            return self._return_change_result(True, INITIAL_DISPLAY)
+
+        expression = state.expression
+        if len(expression) <= 1:
+            state.clear_expression()
+            return self._return_change_result(True, INITIAL_DISPLAY)
+
+        if expression[-1] == ')':
+            i = expression.rfind('(')
+            if i == -1:
+                return self._return_change_result(False)
+            state.set_expression(expression[:i] + expression[i + 2: -1])
             return self._return_change_result(True)
-            
-        except Exception as e:
-            return self._return_change_result(False)
+
+        if len(expression) == 2 and expression[0] == '0':
+            state.clear_expression()
+            return self._return_change_result(True, INITIAL_DISPLAY)
+
+        state.set_expression(expression[:-1])
+        return self._return_change_result(True)
 
     def clear_all(self):
         '''
@@ -410,180 +602,195 @@ class ExpressionManager:
         Returns:
             tuple: (success: bool, updated_expression: str)
         '''
-        try:
-            if self.state.is_calculation_done:
-                self.state.reset_calculation_state()
-            
-            if self.state.expression:
-                self.state.clear_expression()
-                return self._return_change_result(True, CalculatorConfig.INITIAL_DISPLAY)
-            
-            return self._return_change_result(False)
-            
-        except Exception as e:
-            return self._return_change_result(False)
+        if self.state.is_calculation_done:
+            self.state.reset_calculation_state()
 
+        if self.state.expression:
+            self.state.clear_expression()
+            return self._return_change_result(True, INITIAL_DISPLAY)
 
-class ExpressionEvaluator:
-    '''Handles mathematical evaluation of expressions'''
-    
-    @staticmethod
-    def normalize_expression(expression):
-        '''
-        Normalizes expression for evaluation.
-        
-        Args:
-            expression (str): Expression to normalize
-            
-        Returns:
-            str: Normalized expression
-        '''
-        if expression[-1] in ('+', '-', '*', '/', '.'):
-            expression = expression[:-1]
-        return expression.replace('×', '*').replace('÷', '/')
-    
-    @staticmethod
-    def format_result(result):
-        '''
-        Formats calculation result for display.
-        
-        Args:
-            result: Calculation result
-            
-        Returns:
-            str: Formatted result string
-        '''
-        if isinstance(result, str):
-            return result
-            
-        try:
-            result = float(result)
-        except (ValueError, TypeError):
-            return str(result)
-        
-        if result.is_integer():
-            result_int = int(result)
-            result_str = str(result_int)
+        return self._return_change_result(False)
 
-            if len(result_str) > DisplayConfig.MAX_DISPLAY_LENGTH:
-                return f'{result:.{DisplayConfig.SCIENTIFIC_PRECISION}e}'
-            return result_str
-        
-        if abs(result) >= 1e12 or (abs(result) < 1e-6 and result != 0):
-            return f'{result:.{DisplayConfig.SCIENTIFIC_PRECISION}e}'
-        
-        result_str = f'{result:.{DisplayConfig.DECIMAL_PLACES}f}'.rstrip('0').rstrip('.')
-        
-        if len(result_str) > DisplayConfig.MAX_DISPLAY_LENGTH:
-            return f'{result:.{DisplayConfig.SCIENTIFIC_PRECISION}e}'
-        
-        return result_str
-    
-    @staticmethod
-    def evaluate_expression(expression):
-        '''
-        Evaluates mathematical expression.
-        
-        Args:
-            expression (str): Expression to evaluate
-            
-        Returns:
-            str: Formatted result or error message
-        '''
-        if not expression:
-            return ''
-        
-        try:
-            expression = ExpressionEvaluator.normalize_expression(expression)
-            
-            if '%' not in expression:
-                pass
-            else:
-                expression = ExpressionEvaluator._transform_percent_expression(expression)
 
-            result = eval(expression)
-            return ExpressionEvaluator.format_result(result)
-            
-        except Exception as e:
-            return 'Error'
+def normalize_expression(expression):
+    '''
+    Normalizes expression for evaluation.
 
-    @staticmethod
-    def _transform_percent_expression(expression):
-        '''
-        Transforms percent operations in expression to regular mathematical operations.
-        
-        Args:
-            expression (str): Expression with percent symbols
-            
-        Returns:
-            str: Transformed expression without percent symbols
-        '''
-        # Find all tokens including numbers (with optional parentheses), operators, and parentheses
-        tokens = re.findall(r'\(-?\d+(?:\.\d+)?\)%?|-?\d+(?:\.\d+)?%?|[+\-*/()]', expression)
-        
-        transformed_tokens = []
-        prev_value = ''
-        
-        percent_numbers = [percent_number.replace('(', '').replace(')', '') for percent_number in re.findall(r'\(?-?\d+(?:\.\d+)?\)?%', expression)]
-        for i, token in enumerate(tokens):
-            if token.startswith('('):
-                    token = token.replace('(', '').replace(')', '')
-            if token.endswith('%'):
-                number_part = token[:-1]
-                
-                prev_operator = None
-                base_number = None
-                
-                for j in range(i - 1, -1, -1):
-                    if tokens[j] in ['+', '-', '*', '/']:
-                        prev_operator = tokens[j]
-
-                        for k in range(j - 1, -1, -1):
-                            if re.match(r'\(-?\d+(?:\.\d+)?\)|-?\d+(?:\.\d+)?', tokens[k]):
-                                if prev_value != '':
-                                    base_number = prev_value
-                                else:
-                                    base_number = tokens[k] 
-                                break
-                        break
-                
-                if prev_operator in ['+', '-'] and base_number:
-                    current_value = f'({tokens[i - 2]}{prev_operator}({base_number}*{number_part}/100))'
-                    transformed_tokens.append(f'({base_number}*{number_part}/100)')
-                else:
-                    current_value = f'({number_part}/100)'
-                    transformed_tokens.append(f'({number_part}/100)')
-
-                try:
-                    if tokens[i + 2] in percent_numbers:
-                        prev_value = current_value
+    Args:
+        expression (str): Expression to normalize
+
+    Returns:
+        str: Normalized expression
+    '''
+    if expression[-1] in ('+', '-', '*', '/', '.'):
+        expression = expression[:-1]
+    return expression.translate(_OP_TRANS)
+
+
+def format_result(result):
+    '''
+    Formats calculation result for display.
+
+    Args:
+        result: Calculation result
+
+    Returns:
+        str: Formatted result string
+    '''
+    if isinstance(result, str):
+        return result
+
+    try:
+        result = float(result)
+    except (ValueError, TypeError):
+        return str(result)
+
+    return _format_result_cached(result)
+
+
+def evaluate_expression(expression):
+    '''
+    Evaluates mathematical expression.
+
+    Args:
+        expression (str): Expression to evaluate
+
+    Returns:
+        str: Formatted result or error message
+    '''
+    if not expression:
+        return ''
+
+    try:
+        expression = normalize_expression(expression)
+
+        if '%' in expression:
+            expression = _transform_percent_expression(expression)
+        else:
+            # Fast paths for the common cases: a bare number, or a single
+            # binary operation between two literals
+            if expression.replace('.', '', 1).lstrip('-').isdigit():
+                return format_result(float(expression))
+
+            match = _ensure_patterns().binary.match(expression)
+            if match:
+                left, operator, right = match.groups()
+                return format_result(_BINARY_OPS[operator](float(left), float(right)))
+
+        result = _eval_tokens(_tokenize(expression))
+        return format_result(result)
+
+    except Exception as e:
+        return 'Error'
+
+
+def _transform_percent_expression(expression):
+    '''
+    Transforms percent operations in expression to regular mathematical operations.
+
+    Args:
+        expression (str): Expression with percent symbols
+
+    Returns:
+        str: Transformed expression without percent symbols
+    '''
+    # Find all tokens including numbers (with optional parentheses), operators, and parentheses
+    tokens = _ensure_patterns().tokens.findall(expression)
+
+    return ''.join(_transform_tokens(tokens))
+
+
+def _transform_tokens(tokens):
+    '''
+    Rewrites percent tokens as regular mathematical operations.
+
+    Args:
+        tokens (list): Token strings from the percent-aware tokenizer
+
+    Returns:
+        list: Transformed token strings without percent symbols
+    '''
+    transformed_tokens = []
+    prev_value = ''
+
+    # One forward pass records, for each position, the index of the
+    # nearest operator and number token before it, so the percent
+    # branch below does O(1) lookups instead of nested backward scans
+    prev_op = [-1] * len(tokens)
+    prev_num = [-1] * len(tokens)
+    last_op = -1
+    last_num = -1
+    for i, token in enumerate(tokens):
+        prev_op[i] = last_op
+        prev_num[i] = last_num
+        if token in ('+', '-', '*', '/'):
+            last_op = i
+        elif token not in ('(', ')'):
+            last_num = i
+
+    pct_flag = [token.endswith('%') for token in tokens]
+    for i, token in enumerate(tokens):
+        if token.startswith('('):
+            token = token.replace('(', '').replace(')', '')
+        if token.endswith('%'):
+            number_part = token[:-1]
+
+            prev_operator = None
+            base_number = None
+
+            op_idx = prev_op[i]
+            if op_idx != -1:
+                prev_operator = tokens[op_idx]
+                num_idx = prev_num[op_idx]
+                if num_idx != -1:
+                    if prev_value != '':
+                        base_number = prev_value
                     else:
-                        prev_value = ''
-                except IndexError:
-                    prev_value = ''
+                        base_number = tokens[num_idx]
 
+            if prev_operator in ('+', '-') and base_number:
+                current_value = f'({base_number}{prev_operator}({base_number}*{number_part}/100))'
+                transformed_tokens.append(f'({base_number}*{number_part}/100)')
             else:
-                transformed_tokens.append(token)
+                current_value = f'({number_part}/100)'
+                transformed_tokens.append(f'({number_part}/100)')
+
+            if i + 2 < len(tokens) and pct_flag[i + 2]:
+                prev_value = current_value
+            else:
+                prev_value = ''
+
+        else:
+            transformed_tokens.append(token)
+
+    return transformed_tokens
 
-        return ''.join(transformed_tokens)
 
-    
 class CalculatorApp:
     '''Main calculator application GUI'''
 
-    def __init__(self, root, expression_manager, evaluator):
+    __slots__ = ('root', 'expression_manager', '_actions', 'display_label', 'history_label')
+
+    def __init__(self, root, expression_manager):
         '''
         Initialize calculator application.
-        
+
         Args:
             root: Tkinter root window
             expression_manager: Expression management instance
-            evaluator: Expression evaluation instance
         '''
         self.root = root
         self.expression_manager = expression_manager
-        self.evaluator = evaluator
-        
+        self._actions = {
+            'digit': expression_manager.add_digit,
+            'operator': expression_manager.add_operator,
+            'dot': expression_manager.add_decimal_point,
+            'toggle_sign': expression_manager.toggle_sign,
+            'percent': expression_manager.add_percent,
+            'clear_last': expression_manager.clear_last_input,
+            'clear_all': expression_manager.clear_all,
+        }
+
         self._setup_window()
         self._create_labels()
         self._create_button_interface()
@@ -599,16 +806,16 @@ class CalculatorApp:
         '''Create display and history labels'''
         self.display_label = self._design_label(
             CalculatorConfig.DISPLAY_FONT, 
-            CalculatorConfig.INITIAL_DISPLAY
+            INITIAL_DISPLAY
         )
         self.history_label = self._design_label(
             CalculatorConfig.HISTORY_FONT,
-            CalculatorConfig.EMPTY_HISTORY,
+            EMPTY_HISTORY,
             fg = '#AFAFAF',
             pady = (0, 10)
         )
 
-    def _design_label(self, font, text = CalculatorConfig.INITIAL_DISPLAY, fg = CalculatorConfig.TEXT_COLOR, pady = (10, 0)):
+    def _design_label(self, font, text = INITIAL_DISPLAY, fg = CalculatorConfig.TEXT_COLOR, pady = (10, 0)):
         '''
         Create a styled label for the calculator.
         
@@ -642,34 +849,34 @@ class CalculatorApp:
         
         button_definitions = [
             (
-                ('⟵', lambda: self._handle_clear_last()),
-                ('⁺⁄₋', lambda: self._handle_toggle_sign()),
-                ('%', lambda: self._handle_percent()),
-                ('÷', lambda: self._handle_operator('÷'))
+                ('⟵', functools.partial(self._run, 'clear_last')),
+                ('⁺⁄₋', functools.partial(self._run, 'toggle_sign')),
+                ('%', functools.partial(self._run, 'percent')),
+                ('÷', functools.partial(self._run, 'operator', '÷'))
             ),
             (
-                ('7', lambda: self._handle_digit('7')),
-                ('8', lambda: self._handle_digit('8')),
-                ('9', lambda: self._handle_digit('9')),
-                ('×', lambda: self._handle_operator('×'))
+                ('7', functools.partial(self._run, 'digit', '7')),
+                ('8', functools.partial(self._run, 'digit', '8')),
+                ('9', functools.partial(self._run, 'digit', '9')),
+                ('×', functools.partial(self._run, 'operator', '×'))
             ),
             (
-                ('4', lambda: self._handle_digit('4')),
-                ('5', lambda: self._handle_digit('5')),
-                ('6', lambda: self._handle_digit('6')),
-                ('-', lambda: self._handle_operator('-'))
+                ('4', functools.partial(self._run, 'digit', '4')),
+                ('5', functools.partial(self._run, 'digit', '5')),
+                ('6', functools.partial(self._run, 'digit', '6')),
+                ('-', functools.partial(self._run, 'operator', '-'))
             ),
             (
-                ('1', lambda: self._handle_digit('1')),
-                ('2', lambda: self._handle_digit('2')),
-                ('3', lambda: self._handle_digit('3')),
-                ('+', lambda: self._handle_operator('+'))
+                ('1', functools.partial(self._run, 'digit', '1')),
+                ('2', functools.partial(self._run, 'digit', '2')),
+                ('3', functools.partial(self._run, 'digit', '3')),
+                ('+', functools.partial(self._run, 'operator', '+'))
             ),
             (
-                ('⟸', lambda: self._handle_clear_all()),
-                ('0', lambda: self._handle_digit('0')),
-                ('.', lambda: self._handle_decimal_point()),
-                ('=', lambda: self._handle_evaluate())
+                ('⟸', functools.partial(self._run, 'clear_all')),
+                ('0', functools.partial(self._run, 'digit', '0')),
+                ('.', functools.partial(self._run, 'dot')),
+                ('=', self._handle_evaluate)
             )
         ]
 
@@ -690,52 +897,22 @@ class CalculatorApp:
                 )
                 button.grid(row = row_index, column = column_index)
 
-    def _handle_digit(self, digit):
-        '''Handle digit button press'''
-        success, updated_expression = self.expression_manager.add_digit(digit)
-        if success:
-            self._update_display(updated_expression)
-
-    def _handle_operator(self, operator):
-        '''Handle operator button press'''
-        success, updated_expression = self.expression_manager.add_operator(operator)
-        if success:    
-            self._update_display(updated_expression)
-
-    def _handle_decimal_point(self):
-        '''Handle decimal point button press'''
-        success, updated_expression = self.expression_manager.add_decimal_point()
-        if success:
-            self._update_display(updated_expression)
-
-    def _handle_clear_last(self):
-        '''Handle clear last input button press'''
-        success, updated_expression = self.expression_manager.clear_last_input()
-        if success:
-            self._update_display(updated_expression)
-
-    def _handle_clear_all(self):
-        '''Handle clear all button press'''
-        success, updated_expression = self.expression_manager.clear_all()
-        if success:
-            self._update_display(updated_expression)
-
-    def _handle_toggle_sign(self):
-        '''Handle toggle sign button press'''
-        success, updated_expression = self.expression_manager.toggle_sign()
-        if success:
-            self._update_display(updated_expression)
+    def _run(self, action, *args):
+        '''
+        Runs an expression manager action and refreshes the display.
 
-    def _handle_percent(self):
-        '''Handle percent button press'''
-        success, updated_expression = self.expression_manager.add_percent()
+        Args:
+            action (str): Action key in the dispatch table
+            *args: Arguments for the manager method
+        '''
+        success, updated_expression = self._actions[action](*args)
         if success:
             self._update_display(updated_expression)
 
     def _handle_evaluate(self):
         '''Handle equals button press'''
         expression = self.expression_manager.state.expression
-        result = self.evaluator.evaluate_expression(expression)
+        result = evaluate_expression(expression)
 
         if result and result == 'Error':
             self.expression_manager.state.mark_calculation_done()
@@ -747,7 +924,7 @@ class CalculatorApp:
             self.expression_manager.state.mark_calculation_done()
             self._update_display(expression, result)
                 
-    def _update_display(self, expression, result = CalculatorConfig.EMPTY_HISTORY):
+    def _update_display(self, expression, result = EMPTY_HISTORY):
         '''
         Update calculator display labels.
         
@@ -755,7 +932,7 @@ class CalculatorApp:
             expression (str): Current expression
             result (str): Calculation result
         '''
-        if result != CalculatorConfig.EMPTY_HISTORY:
+        if result != EMPTY_HISTORY:
             self.display_label.config(text = result)
             self.history_label.config(text = expression)
             self.expression_manager.state.set_expression(result)
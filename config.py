@@ -25,4 +25,22 @@ class CalculatorConfig:
     
     DISPLAY_FONT = ('Arial', 35)
     HISTORY_FONT = ('Arial', 20)
-    BUTTON_FONT = ('Ani', 35)
\ No newline at end of file
+    BUTTON_FONT = ('Ani', 35)
+
+
+# Module-level aliases for hot-path constants: importing these directly
+# saves the class attribute lookup on every keypress
+OPERATORS = CalculatorConfig.OPERATORS
+INITIAL_DISPLAY = CalculatorConfig.INITIAL_DISPLAY
+EMPTY_HISTORY = CalculatorConfig.EMPTY_HISTORY
+MAX_DISPLAY_LENGTH = DisplayConfig.MAX_DISPLAY_LENGTH
+SCIENTIFIC_PRECISION = DisplayConfig.SCIENTIFIC_PRECISION
+DECIMAL_PLACES = DisplayConfig.DECIMAL_PLACES
+
+# Frozen membership sets for hot-path `in` tests: O(1) hashed lookup
+# with no per-call list concatenation
+OPERATORS_SET = frozenset(CalculatorConfig.OPERATORS)
+OPERATORS_PCT = OPERATORS_SET | {'%'}
+OPERATORS_DOT = OPERATORS_SET | {'.'}
+SPECIAL_SET = frozenset(CalculatorConfig.SPECIAL_CHARS)
+OP_OR_SPECIAL = OPERATORS_SET | SPECIAL_SET
\ No newline at end of file
@@ -1,13 +1,11 @@
 import tkinter as tk
-from calculatorgui import CalculatorApp, ExpressionManager, ExpressionEvaluator
+from calculator import CalculatorApp, ExpressionManager
 
 
 if __name__ == '__main__':
     root = tk.Tk()
-    
-    # Dependency injection
+
     expression_manager = ExpressionManager()
-    evaluator = ExpressionEvaluator()
-    
-    app = CalculatorApp(root, expression_manager, evaluator)
-    root.mainloop()
\ No newline at end of file
+
+    app = CalculatorApp(root, expression_manager)
+    root.mainloop()
@@ -1,14 +1,14 @@
 from config import CalculatorConfig
 
 
-def _get_button_colors(row, column):
+def _pick_button_colors(row, column):
     '''
-    Get button colors based on position.
-        
+    Picks button colors based on position.
+
     Args:
         row (int): Button row
         column (int): Button column
-            
+
     Returns:
         tuple: (normal_color, active_color)
     '''
@@ -17,4 +17,25 @@ def _get_button_colors(row, column):
     elif column == 3:
         return CalculatorConfig.BUTTON_OPERATOR_COLOR, CalculatorConfig.BUTTON_OPERATOR_COLOR_ACTIVE
     else:
-        return CalculatorConfig.BUTTON_COLOR_2, CalculatorConfig.BUTTON_COLOR_ACTIVE_2
\ No newline at end of file
+        return CalculatorConfig.BUTTON_COLOR_2, CalculatorConfig.BUTTON_COLOR_ACTIVE_2
+
+
+# Color pairs for the 5x4 button grid, resolved once at import
+_COLOR_GRID = tuple(
+    tuple(_pick_button_colors(row, column) for column in range(4))
+    for row in range(5)
+)
+
+
+def _get_button_colors(row, column):
+    '''
+    Get button colors based on position.
+
+    Args:
+        row (int): Button row
+        column (int): Button column
+
+    Returns:
+        tuple: (normal_color, active_color)
+    '''
+    return _COLOR_GRID[row][column]